@@ -12,16 +12,17 @@ data class Complex(val real: Double, val imag: Double) {
     )
     operator fun times(scalar: Double) = Complex(real * scalar, imag * scalar)
     operator fun div(scalar: Double) = Complex(real / scalar, imag / scalar)
+    /**
+     * Complex division. Division by zero follows IEEE semantics and yields
+     * Infinity/NaN components rather than a silent zero, so degenerate
+     * lattices surface as non-finite results instead of wrong geometry.
+     */
     operator fun div(other: Complex): Complex {
         val denominator = other.real * other.real + other.imag * other.imag
-        return if (denominator != 0.0) {
-            Complex(
-                (real * other.real + imag * other.imag) / denominator,
-                (imag * other.real - real * other.imag) / denominator
-            )
-        } else {
-            Complex(0.0, 0.0) // Or throw an exception
-        }
+        return Complex(
+            (real * other.real + imag * other.imag) / denominator,
+            (imag * other.real - real * other.imag) / denominator
+        )
     }
     
     val magnitude: Double get() = kotlin.math.sqrt(real * real + imag * imag)
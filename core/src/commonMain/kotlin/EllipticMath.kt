@@ -0,0 +1,473 @@
+package com.pqtorus.core
+
+import kotlin.math.pow
+
+/**
+ * Numerically evaluate the Eisenstein series sum over the period lattice,
+ *   G_k(ω₁, ω₂) = Σ' 1/(m·ω₁ + n·ω₂)^k
+ * truncated at |m|, |n| <= nMax (the origin term is excluded).
+ *
+ * The inner loop works on raw doubles with the complex reciprocal inlined as
+ * (x − iy)/(x² + y²), so no Complex instances are allocated per lattice point
+ * and the loop compiles to straight-line arithmetic on every target.
+ * Antipodal points satisfy (−ω)⁻ᵏ = (−1)ᵏ·ω⁻ᵏ, so only half the grid is
+ * walked: for even k the half sum is doubled, and for odd k the pairs cancel
+ * to zero outright.
+ */
+fun eisensteinSeriesNumeric(omega1: Complex, omega2: Complex, nMax: Int, k: Int): Complex {
+    if (k % 2 != 0) {
+        return Complex(0.0, 0.0)
+    }
+
+    val w1r = omega1.real
+    val w1i = omega1.imag
+    val w2r = omega2.real
+    val w2i = omega2.imag
+
+    var sumRe = 0.0
+    var sumIm = 0.0
+
+    // One representative per antipodal pair: m > 0, plus the positive half
+    // of the m = 0 column
+    for (m in 0..nMax) {
+        for (n in (if (m > 0) -nMax else 1)..nMax) {
+            // L = m*omega1 + n*omega2
+            val lr = m * w1r + n * w2r
+            val li = m * w1i + n * w2i
+
+            // 1/L via complex reciprocal
+            val norm = lr * lr + li * li
+            val re = lr / norm
+            val im = -li / norm
+
+            // (1/L)^k by repeated multiplication (k is small: 4 or 6)
+            var termRe = re
+            var termIm = im
+            for (e in 1 until k) {
+                val nextRe = termRe * re - termIm * im
+                termIm = termRe * im + termIm * re
+                termRe = nextRe
+            }
+
+            sumRe += termRe
+            sumIm += termIm
+        }
+    }
+
+    return Complex(2 * sumRe, 2 * sumIm)
+}
+
+/**
+ * The pair of Eisenstein invariants of a lattice
+ */
+data class EisensteinPair(val g2: Complex, val g3: Complex)
+
+/**
+ * Evaluate g₂ = 60·G₄ and g₃ = 140·G₆ in a single sweep over the lattice.
+ *
+ * The powers share work: inv2 = 1/L² costs the only division, then
+ * inv4 = inv2² and inv6 = inv4·inv2 follow by multiplication, so each lattice
+ * point contributes to both invariants in one pass instead of two
+ * independent power chains.
+ */
+fun eisensteinG2G3(omega1: Complex, omega2: Complex, nMax: Int = 20): EisensteinPair {
+    val w1r = omega1.real
+    val w1i = omega1.imag
+    val w2r = omega2.real
+    val w2i = omega2.imag
+
+    var sum4Re = 0.0
+    var sum4Im = 0.0
+    var sum6Re = 0.0
+    var sum6Im = 0.0
+
+    // Both exponents are even, so the (m, n) and (−m, −n) terms are equal:
+    // summing the n >= 1 half-plane plus the m >= 1 half of the n = 0 row and
+    // doubling covers the whole lattice with half the work. For rectangular
+    // lattices (ω₁ real, ω₂ purely imaginary) the reflection m → −m conjugates
+    // each term, so the sums are real and the m >= 0 quadrant suffices —
+    // a further 2× reduction.
+    val rectangular = w1i == 0.0 && w2r == 0.0
+    val mStart = if (rectangular) 0 else -nMax
+
+    // Disk truncation |L| ≤ nMax·min(|ω₁|, |ω₂|): the square grid's corner
+    // regions are anisotropic, so their e^{−ikθ} phases do not average out
+    // and they dominate the truncation error; cutting at the largest
+    // complete radius restores the angular cancellation (the corresponding
+    // analytic tail integral vanishes for k ≥ 4) and tightens the sum at
+    // fewer terms.
+    val mod1 = w1r * w1r + w1i * w1i
+    val mod2 = w2r * w2r + w2i * w2i
+    val cutoff = nMax.toDouble() * nMax * minOf(mod1, mod2) * (1 + 1e-12)
+
+    for (m in mStart..nMax) {
+        for (n in (if (m > 0) 0 else 1)..nMax) {
+            val lr = m * w1r + n * w2r
+            val li = m * w1i + n * w2i
+            if (lr * lr + li * li > cutoff) continue
+
+            // inv2 = 1/L²
+            val l2r = lr * lr - li * li
+            val l2i = 2 * lr * li
+            val norm = l2r * l2r + l2i * l2i
+            val inv2Re = l2r / norm
+            val inv2Im = -l2i / norm
+
+            // inv4 = inv2², inv6 = inv4·inv2
+            val inv4Re = inv2Re * inv2Re - inv2Im * inv2Im
+            val inv4Im = 2 * inv2Re * inv2Im
+            val inv6Re = inv4Re * inv2Re - inv4Im * inv2Im
+            val inv6Im = inv4Re * inv2Im + inv4Im * inv2Re
+
+            // In the rectangular quadrant, interior points (m >= 1, n >= 1)
+            // also stand in for their m → −m mirrors (the conjugate terms;
+            // the imaginary parts cancel and are zeroed below)
+            val weight = if (rectangular && m >= 1 && n >= 1) 2 else 1
+            sum4Re += weight * inv4Re
+            sum4Im += weight * inv4Im
+            sum6Re += weight * inv6Re
+            sum6Im += weight * inv6Im
+        }
+    }
+
+    if (rectangular) {
+        // The full sums are real by conjugation symmetry
+        sum4Im = 0.0
+        sum6Im = 0.0
+    }
+
+    return EisensteinPair(
+        g2 = Complex(120 * sum4Re, 120 * sum4Im),
+        g3 = Complex(280 * sum6Re, 280 * sum6Im)
+    )
+}
+
+private const val EISENSTEIN_CACHE_LIMIT = 128
+private val eisensteinCache = LinkedHashMap<String, EisensteinPair>()
+
+/**
+ * Cached variant of [eisensteinG2G3]. The invariants are pure in
+ * (ω₁, ω₂, nMax) and are recomputed with identical arguments on every
+ * geometry regeneration, so repeats collapse to a map lookup. Bounded with
+ * least-recently-used eviction like the lattice-table cache.
+ */
+fun cachedEisensteinG2G3(omega1: Complex, omega2: Complex, nMax: Int = 20): EisensteinPair {
+    val key = "${omega1.real},${omega1.imag},${omega2.real},${omega2.imag},$nMax"
+    eisensteinCache.remove(key)?.let { hit ->
+        eisensteinCache[key] = hit
+        return hit
+    }
+    val pair = eisensteinG2G3(omega1, omega2, nMax)
+    if (eisensteinCache.size >= EISENSTEIN_CACHE_LIMIT) {
+        eisensteinCache.remove(eisensteinCache.keys.first())
+    }
+    eisensteinCache[key] = pair
+    return pair
+}
+
+/**
+ * Eisenstein invariants of the degree-d sublattice L_d = 2⁻ᵈ·L of the
+ * (p, q) lattice. The series are homogeneous — g₂(sL) = s⁻⁴·g₂(L) and
+ * g₃(sL) = s⁻⁶·g₃(L) — so every degree is two scalings of the cached
+ * primary pair rather than a fresh lattice walk.
+ */
+fun sublatticeEisensteinG2G3(p: Double, q: Double, d: Int, nMax: Int = 20): EisensteinPair {
+    val base = cachedEisensteinG2G3(Complex(p, 0.0), Complex(0.0, q), nMax)
+    if (d == 0) return base
+    val s4 = 2.0.pow(4 * d) // s⁻⁴ with s = 2⁻ᵈ
+    val s6 = 2.0.pow(6 * d)
+    return EisensteinPair(base.g2 * s4, base.g3 * s6)
+}
+
+/**
+ * An oriented period lattice Z·ω₁ + Z·ω₂.
+ *
+ * The periods are immutable; the period ratio τ = ω₂/ω₁ is computed lazily
+ * on first access and cached, so constructing a lattice costs nothing beyond
+ * storing the two period references.
+ */
+class Lattice(val omega1: Complex, val omega2: Complex) {
+    val tau: Complex by lazy { omega2 / omega1 }
+
+    companion object {
+        private const val SUBLATTICE_CACHE_LIMIT = 64
+        private val sublatticeCache = LinkedHashMap<String, Lattice>()
+
+        /**
+         * The degree-d sublattice L_d of the (p, q) lattice, with periods
+         * p·2⁻ᵈ and iq·2⁻ᵈ. Instances are interned, so repeated requests
+         * with the same parameters return one shared object and the 2⁻ᵈ
+         * scale is computed once per (p, q, d).
+         */
+        fun sublatticeLd(p: Double, q: Double, d: Int): Lattice {
+            val key = "$p,$q,$d"
+            sublatticeCache.remove(key)?.let { hit ->
+                sublatticeCache[key] = hit
+                return hit
+            }
+            val scale = 1.0 / (1 shl d)
+            val lattice = Lattice(Complex(p * scale, 0.0), Complex(0.0, q * scale))
+            if (sublatticeCache.size >= SUBLATTICE_CACHE_LIMIT) {
+                sublatticeCache.remove(sublatticeCache.keys.first())
+            }
+            sublatticeCache[key] = lattice
+            return lattice
+        }
+
+        /**
+         * The primary (p, q) lattice — just the degree-0 sublattice, so
+         * both entry points share one implementation and one cache.
+         */
+        fun primary(p: Double, q: Double): Lattice = sublatticeLd(p, q, 0)
+    }
+}
+
+/**
+ * Precomputed table of the nonzero lattice points ω = m·ω₁ + n·ω₂ with
+ * |m|, |n| <= nMax, stored as parallel coordinate arrays together with the
+ * precomputed constant terms 1/ω² of the Weierstrass series. Only one
+ * representative of each antipodal pair {ω, −ω} is stored; the evaluators
+ * visit both points from one entry, halving the table. Built once per
+ * lattice and shared across every mesh vertex.
+ */
+private data class LatticeTablePoint(val wr: Double, val wi: Double, val r2: Double)
+
+class LatticeTable(omega1: Complex, omega2: Complex, nMax: Int = 10) {
+    val size: Int
+    val re: DoubleArray
+    val im: DoubleArray
+    val inv2Re: DoubleArray
+    val inv2Im: DoubleArray
+
+    init {
+        // One representative per antipodal pair: m > 0, plus the positive
+        // half of the m = 0 column, collected with squared moduli so the
+        // points can be ordered and truncated by radius
+        val count = ((2 * nMax + 1) * (2 * nMax + 1) - 1) / 2
+        val points = ArrayList<LatticeTablePoint>(count)
+        for (m in 0..nMax) {
+            for (n in (if (m > 0) -nMax else 1)..nMax) {
+                val wr = m * omega1.real + n * omega2.real
+                val wi = m * omega1.imag + n * omega2.imag
+                points.add(LatticeTablePoint(wr, wi, wr * wr + wi * wi))
+            }
+        }
+
+        // The series terms decay like |ω|⁻³, so summing in decreasing-|ω|
+        // order accumulates the smallest contributions before the dominant
+        // near-origin terms, keeping the reduction error near machine level
+        points.sortByDescending { it.r2 }
+
+        // Disk truncation: the square grid is only radius-complete out to
+        // R = nMax·min(|ω₁|, |ω₂|); points beyond R form partial shells
+        // whose contribution is below the truncation error already set at R,
+        // so dropping them (a prefix of the descending sort) trims the table
+        // at no accuracy cost
+        val m1 = omega1.real * omega1.real + omega1.imag * omega1.imag
+        val m2 = omega2.real * omega2.real + omega2.imag * omega2.imag
+        val cutoff = nMax.toDouble() * nMax * minOf(m1, m2) * (1 + 1e-12)
+        var start = 0
+        while (start < count && points[start].r2 > cutoff) start++
+
+        size = count - start
+        re = DoubleArray(size)
+        im = DoubleArray(size)
+        inv2Re = DoubleArray(size)
+        inv2Im = DoubleArray(size)
+
+        for (k in 0 until size) {
+            val point = points[start + k]
+            val wr = point.wr
+            val wi = point.wi
+            re[k] = wr
+            im[k] = wi
+
+            // 1/ω² precomputed so the ℘ inner loop only subtracts it
+            val w2r = wr * wr - wi * wi
+            val w2i = 2 * wr * wi
+            val norm = w2r * w2r + w2i * w2i
+            inv2Re[k] = w2r / norm
+            inv2Im[k] = -w2i / norm
+        }
+    }
+}
+
+private const val LATTICE_TABLE_CACHE_LIMIT = 32
+private val latticeTableCache = LinkedHashMap<String, LatticeTable>()
+
+/**
+ * Return a cached [LatticeTable] for the given lattice, building it on first
+ * use. The table depends only on (ω₁, ω₂, nMax), so repeated torus
+ * generations over the same lattice — the common case when only the mesh
+ * density or degree changes — reuse one table instead of rebuilding it.
+ * A small bounded cache with least-recently-used eviction keeps memory flat.
+ */
+fun cachedLatticeTable(omega1: Complex, omega2: Complex, nMax: Int = 10): LatticeTable {
+    val key = "${omega1.real},${omega1.imag},${omega2.real},${omega2.imag},$nMax"
+    latticeTableCache.remove(key)?.let { hit ->
+        // Reinsert so insertion order tracks recency of use
+        latticeTableCache[key] = hit
+        return hit
+    }
+    val table = LatticeTable(omega1, omega2, nMax)
+    if (latticeTableCache.size >= LATTICE_TABLE_CACHE_LIMIT) {
+        latticeTableCache.remove(latticeTableCache.keys.first())
+    }
+    latticeTableCache[key] = table
+    return table
+}
+
+/**
+ * Weierstrass ℘ function,
+ *   ℘(z) = 1/z² + Σ' [1/(z−ω)² − 1/ω²]
+ * summed over the truncated lattice table on raw doubles. Each table entry
+ * contributes its antipodal pair at once:
+ *   1/(z−ω)² + 1/(z+ω)² − 2/ω².
+ */
+fun weierstrassP(z: Complex, table: LatticeTable): Complex {
+    val zr = z.real
+    val zi = z.imag
+
+    // 1/z² leading term
+    val z2r = zr * zr - zi * zi
+    val z2i = 2 * zr * zi
+    val zNorm = z2r * z2r + z2i * z2i
+    var sumRe = z2r / zNorm
+    var sumIm = -z2i / zNorm
+
+    for (k in 0 until table.size) {
+        // 1/(z−ω)²
+        val ar = zr - table.re[k]
+        val ai = zi - table.im[k]
+        val a2r = ar * ar - ai * ai
+        val a2i = 2 * ar * ai
+        val aNorm = a2r * a2r + a2i * a2i
+
+        // 1/(z+ω)²
+        val br = zr + table.re[k]
+        val bi = zi + table.im[k]
+        val b2r = br * br - bi * bi
+        val b2i = 2 * br * bi
+        val bNorm = b2r * b2r + b2i * b2i
+
+        sumRe += a2r / aNorm + b2r / bNorm - 2 * table.inv2Re[k]
+        sumIm += -a2i / aNorm - b2i / bNorm - 2 * table.inv2Im[k]
+    }
+
+    return Complex(sumRe, sumIm)
+}
+
+/**
+ * Batch-evaluate ℘ at many points in one call.
+ *
+ * Takes the sample points as parallel coordinate arrays and writes the
+ * results into the provided output arrays, so a whole mesh grid is
+ * processed with zero per-point object allocation.
+ */
+fun weierstrassPBatch(
+    zRe: DoubleArray,
+    zIm: DoubleArray,
+    table: LatticeTable,
+    outRe: DoubleArray,
+    outIm: DoubleArray
+) {
+    for (p in zRe.indices) {
+        val zr = zRe[p]
+        val zi = zIm[p]
+
+        val z2r = zr * zr - zi * zi
+        val z2i = 2 * zr * zi
+        val zNorm = z2r * z2r + z2i * z2i
+        var sumRe = z2r / zNorm
+        var sumIm = -z2i / zNorm
+
+        for (k in 0 until table.size) {
+            // Antipodal pair 1/(z−ω)² + 1/(z+ω)² − 2/ω² per entry
+            val ar = zr - table.re[k]
+            val ai = zi - table.im[k]
+            val a2r = ar * ar - ai * ai
+            val a2i = 2 * ar * ai
+            val aNorm = a2r * a2r + a2i * a2i
+
+            val br = zr + table.re[k]
+            val bi = zi + table.im[k]
+            val b2r = br * br - bi * bi
+            val b2i = 2 * br * bi
+            val bNorm = b2r * b2r + b2i * b2i
+
+            sumRe += a2r / aNorm + b2r / bNorm - 2 * table.inv2Re[k]
+            sumIm += -a2i / aNorm - b2i / bNorm - 2 * table.inv2Im[k]
+        }
+
+        outRe[p] = sumRe
+        outIm[p] = sumIm
+    }
+}
+
+/**
+ * The value pair (℘(z), ℘'(z))
+ */
+data class WeierstrassPair(val wp: Complex, val wpPrime: Complex)
+
+/**
+ * Evaluate ℘(z) and ℘'(z) together in a single pass over the lattice table.
+ *
+ * Each lattice point needs 1/(z−ω)² for ℘ and 1/(z−ω)³ for ℘'; computing the
+ * reciprocal 1/(z−ω) once and raising it by multiplication shares the only
+ * division between both series, roughly halving the cost versus two
+ * independent walks.
+ */
+fun weierstrassPAndPrime(z: Complex, table: LatticeTable): WeierstrassPair {
+    val zr = z.real
+    val zi = z.imag
+
+    // Leading terms 1/z² and −2/z³
+    val zNorm = zr * zr + zi * zi
+    val invZRe = zr / zNorm
+    val invZIm = -zi / zNorm
+    val invZ2Re = invZRe * invZRe - invZIm * invZIm
+    val invZ2Im = 2 * invZRe * invZIm
+    var pRe = invZ2Re
+    var pIm = invZ2Im
+    var ppRe = -2 * (invZ2Re * invZRe - invZ2Im * invZIm)
+    var ppIm = -2 * (invZ2Re * invZIm + invZ2Im * invZRe)
+
+    for (k in 0 until table.size) {
+        // inv = 1/(z−ω); inv² and inv³ by multiplication
+        val ar = zr - table.re[k]
+        val ai = zi - table.im[k]
+        val aNorm = ar * ar + ai * ai
+        val aInvRe = ar / aNorm
+        val aInvIm = -ai / aNorm
+        val aInv2r = aInvRe * aInvRe - aInvIm * aInvIm
+        val aInv2i = 2 * aInvRe * aInvIm
+
+        // Antipodal partner 1/(z+ω)
+        val br = zr + table.re[k]
+        val bi = zi + table.im[k]
+        val bNorm = br * br + bi * bi
+        val bInvRe = br / bNorm
+        val bInvIm = -bi / bNorm
+        val bInv2r = bInvRe * bInvRe - bInvIm * bInvIm
+        val bInv2i = 2 * bInvRe * bInvIm
+
+        pRe += aInv2r + bInv2r - 2 * table.inv2Re[k]
+        pIm += aInv2i + bInv2i - 2 * table.inv2Im[k]
+        ppRe += -2 * (aInv2r * aInvRe - aInv2i * aInvIm + bInv2r * bInvRe - bInv2i * bInvIm)
+        ppIm += -2 * (aInv2r * aInvIm + aInv2i * aInvRe + bInv2r * bInvIm + bInv2i * bInvRe)
+    }
+
+    return WeierstrassPair(Complex(pRe, pIm), Complex(ppRe, ppIm))
+}
+
+/**
+ * Eisenstein invariant g₂ = 60·G₄(ω₁, ω₂)
+ */
+fun eisensteinG2(omega1: Complex, omega2: Complex, nMax: Int = 20): Complex =
+    cachedEisensteinG2G3(omega1, omega2, nMax).g2
+
+/**
+ * Eisenstein invariant g₃ = 140·G₆(ω₁, ω₂)
+ */
+fun eisensteinG3(omega1: Complex, omega2: Complex, nMax: Int = 20): Complex =
+    cachedEisensteinG2G3(omega1, omega2, nMax).g3
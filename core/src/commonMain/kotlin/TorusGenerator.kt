@@ -15,22 +15,21 @@ class TorusGenerator {
      * @param meshDensity Number of subdivisions for the mesh
      */
     fun generateTorus(p: Double, q: Double, degree: Int, meshDensity: Int = 20): TorusGeometry {
-        // Create lattice periods
-        val period1 = Complex(p, 0.0)
-        val period2 = Complex(0.0, q)
-        
-        // Calculate tau = period2 / period1
-        val tau = if (period1.real != 0.0) {
-            Complex(period2.real / period1.real, period2.imag / period1.real)
-        } else {
-            Complex(0.0, 1.0) // Default fallback
-        }
-        
-        // Generate lattice points for degree d approximation
-        val latticePoints = generateLatticePoints(period1, period2, degree)
-        
-        // Project to torus surface and create 3D vertices
-        val vertices = projectToTorus(latticePoints, period1, period2, meshDensity)
+        // The primary lattice and its degree-d sublattice come from the
+        // interning factory, so repeated generations reuse the same objects
+        // and the 2^(-d) scale is computed once per (p, q, d)
+        val lattice = Lattice.primary(p, q)
+        val sublattice = Lattice.sublatticeLd(p, q, degree)
+        val period1 = lattice.omega1
+        val period2 = lattice.omega2
+        val tau = lattice.tau
+
+        // Project to torus surface and create 3D vertices using the
+        // sublattice periods so the embedding reflects L_d. The sampling is
+        // implicit: vertex positions come from midpoint fractions of the
+        // fundamental domain, so no explicit grid of lattice points is
+        // materialized.
+        val vertices = projectToTorus(sublattice.omega1, sublattice.omega2, meshDensity)
         
         // Generate facets (quadrilaterals)
         val facets = generateFacets(meshDensity)
@@ -47,46 +46,88 @@ class TorusGenerator {
         )
     }
     
-    private fun generateLatticePoints(period1: Complex, period2: Complex, degree: Int): List<Complex> {
-        val points = mutableListOf<Complex>()
-        val scale = 1.0 / (1 shl degree) // 2^(-degree)
-        
-        // Generate points in the fundamental domain
-        val range = 10 // Reasonable range for visualization
-        for (n1 in -range..range) {
-            for (n2 in -range..range) {
-                val point = period1 * (n1 * scale) + period2 * (n2 * scale)
-                points.add(point)
-            }
-        }
-        return points
-    }
-    
     private fun projectToTorus(
-        latticePoints: List<Complex>, 
-        period1: Complex, 
+        period1: Complex,
         period2: Complex,
         meshDensity: Int
     ): List<Vertex3D> {
-        val vertices = mutableListOf<Vertex3D>()
-        
+        val vertices = ArrayList<Vertex3D>(meshDensity * meshDensity)
+
         // Create a regular torus parametrization
         val majorRadius = 2.0
         val minorRadius = 0.5
-        
+
+        // Bounded modulation strength for the Weierstrass displacement so
+        // poles of ℘ cannot blow up the geometry
+        val displacementScale = 0.15
+        val displacementLimit = 0.35
+
+        // One lattice table shared by every vertex, cached across calls so
+        // regenerating over the same lattice skips the rebuild entirely
+        val latticeTable = cachedLatticeTable(period1, period2, 6)
+
+        // Only meshDensity distinct angles occur along each direction, so
+        // compute the trig tables once instead of meshDensity² times in the
+        // inner loop
+        val angleStep = 2 * PI / meshDensity
+        val cosTable = DoubleArray(meshDensity)
+        val sinTable = DoubleArray(meshDensity)
         for (i in 0 until meshDensity) {
+            val angle = i * angleStep
+            cosTable[i] = cos(angle)
+            sinTable[i] = sin(angle)
+        }
+
+        // Sample ℘ at cell midpoints of the fundamental domain so z never
+        // lands exactly on a lattice point (where ℘ has a double pole); the
+        // whole grid goes through one batch call on flat double arrays
+        val vertexCount = meshDensity * meshDensity
+        val zRe = DoubleArray(vertexCount)
+        val zIm = DoubleArray(vertexCount)
+        var sampleIndex = 0
+        for (i in 0 until meshDensity) {
+            val s = (i + 0.5) / meshDensity
+            val rowRe = period1.real * s
+            val rowIm = period1.imag * s
             for (j in 0 until meshDensity) {
-                val u = 2 * PI * i / meshDensity
-                val v = 2 * PI * j / meshDensity
-                
-                val x = (majorRadius + minorRadius * cos(v)) * cos(u)
-                val y = (majorRadius + minorRadius * cos(v)) * sin(u)
-                val z = minorRadius * sin(v)
-                
-                vertices.add(Vertex3D(x, y, z))
+                val t = (j + 0.5) / meshDensity
+                zRe[sampleIndex] = rowRe + period2.real * t
+                zIm[sampleIndex] = rowIm + period2.imag * t
+                sampleIndex++
             }
         }
-        
+        val wpRe = DoubleArray(vertexCount)
+        val wpIm = DoubleArray(vertexCount)
+        weierstrassPBatch(zRe, zIm, latticeTable, wpRe, wpIm)
+
+        for (i in 0 until meshDensity) {
+            val cosU = cosTable[i]
+            val sinU = sinTable[i]
+            val rowOffset = i * meshDensity
+
+            for (j in 0 until meshDensity) {
+                val wpIndex = rowOffset + j
+
+                // Modulate the minor radius with Re ℘ and the height with
+                // Im ℘; one finiteness mask per vertex falls back to the
+                // classical torus coordinates near poles
+                var radial = displacementScale * wpRe[wpIndex]
+                var vertical = displacementScale * wpIm[wpIndex]
+                if (!(radial + vertical).isFinite()) {
+                    radial = 0.0
+                    vertical = 0.0
+                } else {
+                    radial = radial.coerceIn(-displacementLimit, displacementLimit)
+                    vertical = vertical.coerceIn(-displacementLimit, displacementLimit)
+                }
+
+                val r = minorRadius + radial
+                val ring = majorRadius + r * cosTable[j]
+
+                vertices.add(Vertex3D(ring * cosU, ring * sinU, r * sinTable[j] + vertical))
+            }
+        }
+
         return vertices
     }
     
@@ -113,18 +154,18 @@ class TorusGenerator {
     )
     
     private fun calculateEllipticInvariants(period1: Complex, period2: Complex): EllipticInvariants {
-        // Simplified calculation for demonstration
-        // In a full implementation, these would be proper elliptic function calculations
-        
-        // Calculate tau = period2 / period1
-        val tau = period2 / period1
-        
-        // Simplified j-invariant approximation
-        val jInvariant = Complex(1728.0, 0.0) // Placeholder
-        
-        // Simplified discriminant
-        val discriminant = period1 * period2
-        
+        // Eisenstein invariants of the lattice Z·period1 + Z·period2,
+        // computed together so the lattice is walked once, and cached so
+        // repeated generations with the same periods skip the walk entirely
+        val (g2, g3) = cachedEisensteinG2G3(period1, period2)
+
+        // Modular discriminant Δ = g₂³ − 27·g₃²
+        val g2Cubed = g2 * g2 * g2
+        val discriminant = g2Cubed - g3 * g3 * 27.0
+
+        // j-invariant j = 1728·g₂³ / Δ
+        val jInvariant = (g2Cubed * 1728.0) / discriminant
+
         return EllipticInvariants(jInvariant, discriminant)
     }
 }
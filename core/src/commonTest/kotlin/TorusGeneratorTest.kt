@@ -39,6 +39,16 @@ class TorusGeneratorTest {
         assertEquals(7, nextPrime(6))
     }
     
+    @Test
+    fun testEisensteinInvariants() {
+        // Square lattice: g3 vanishes by symmetry and j = 1728
+        val g3 = eisensteinG3(Complex(2.0, 0.0), Complex(0.0, 2.0))
+        assertTrue(g3.magnitude < 1e-3)
+
+        val geometry = TorusGenerator().generateTorus(2.0, 2.0, 0, 8)
+        assertTrue(kotlin.math.abs(geometry.jInvariant.real - 1728.0) < 1e-3)
+    }
+
     @Test
     fun testTorusGeneration() {
         val generator = TorusGenerator()
@@ -2,31 +2,63 @@ package com.pqtorus.core
 
 private val torusGenerator = TorusGenerator()
 
+private const val TORUS_JSON_CACHE_LIMIT = 8
+private val torusJsonCache = LinkedHashMap<String, String>()
+
 /**
- * Generate torus geometry and return as JSON string
+ * Generate torus geometry and return as JSON string.
+ *
+ * The result is a pure function of the four parameters, and the UI calls
+ * this repeatedly with identical arguments on re-renders, so a small
+ * least-recently-used cache of serialized results turns those repeats into
+ * a map lookup instead of a full geometry build plus serialization.
  */
 @JsExport
 fun generateTorusJson(p: Double, q: Double, degree: Int, meshDensity: Int = 20): String {
+    val key = "$p,$q,$degree,$meshDensity"
+    torusJsonCache.remove(key)?.let { hit ->
+        torusJsonCache[key] = hit
+        return hit
+    }
+
     val geometry = torusGenerator.generateTorus(p, q, degree, meshDensity)
-    
-    // Manual JSON serialization since kotlinx.serialization doesn't support Wasm yet
-    val verticesJson = geometry.vertices.joinToString(",") { vertex ->
-        "{\"x\":${vertex.x},\"y\":${vertex.y},\"z\":${vertex.z}}"
+
+    // Manual JSON serialization since kotlinx.serialization doesn't support
+    // Wasm yet. One presized StringBuilder pass instead of joinToString, so
+    // no intermediate per-vertex strings are allocated and the buffer never
+    // regrows for typical mesh sizes.
+    val sb = StringBuilder(geometry.vertices.size * 72 + geometry.facets.size * 48 + 256)
+    sb.append("{\"vertices\":[")
+    for ((index, vertex) in geometry.vertices.withIndex()) {
+        if (index > 0) sb.append(',')
+        sb.append("{\"x\":").append(vertex.x)
+            .append(",\"y\":").append(vertex.y)
+            .append(",\"z\":").append(vertex.z)
+            .append('}')
+    }
+    sb.append("],\"facets\":[")
+    for ((index, facet) in geometry.facets.withIndex()) {
+        if (index > 0) sb.append(',')
+        sb.append("{\"v1\":").append(facet.v1)
+            .append(",\"v2\":").append(facet.v2)
+            .append(",\"v3\":").append(facet.v3)
+            .append(",\"v4\":").append(facet.v4)
+            .append('}')
     }
-    
-    val facetsJson = geometry.facets.joinToString(",") { facet ->
-        "{\"v1\":${facet.v1},\"v2\":${facet.v2},\"v3\":${facet.v3},\"v4\":${facet.v4}}"
+    sb.append("],\"jInvariant\":{\"real\":").append(geometry.jInvariant.real)
+        .append(",\"imag\":").append(geometry.jInvariant.imag)
+        .append("},\"discriminant\":{\"real\":").append(geometry.discriminant.real)
+        .append(",\"imag\":").append(geometry.discriminant.imag)
+        .append("},\"tau\":{\"real\":").append(geometry.tau.real)
+        .append(",\"imag\":").append(geometry.tau.imag)
+        .append("}}")
+    val json = sb.toString()
+
+    if (torusJsonCache.size >= TORUS_JSON_CACHE_LIMIT) {
+        torusJsonCache.remove(torusJsonCache.keys.first())
     }
-    
-    return """
-        {
-            "vertices":[$verticesJson],
-            "facets":[$facetsJson],
-            "jInvariant":{"real":${geometry.jInvariant.real},"imag":${geometry.jInvariant.imag}},
-            "discriminant":{"real":${geometry.discriminant.real},"imag":${geometry.discriminant.imag}},
-            "tau":{"real":${geometry.tau.real},"imag":${geometry.tau.imag}}
-        }
-    """.trimIndent()
+    torusJsonCache[key] = json
+    return json
 }
 
 /**
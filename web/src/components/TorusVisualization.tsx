@@ -3,40 +3,41 @@ import { Canvas, useFrame } from '@react-three/fiber'
 import { OrbitControls, Grid } from '@react-three/drei'
 import * as THREE from 'three'
 import { TorusParams } from '../App'
-import { generateTorusGeometry } from '../utils/torusGenerator'
+import { generateTorusGeometry, TorusGeometry } from '../utils/torusGenerator'
 
 interface TorusVisualizationProps {
   params: TorusParams
 }
 
-function TorusMesh({ params }: { params: TorusParams }) {
+function TorusMesh({ torusData, params }: { torusData: TorusGeometry; params: TorusParams }) {
   const meshRef = useRef<THREE.Mesh>(null)
-  
+
   const geometry = useMemo(() => {
-    const torusData = generateTorusGeometry(params.p, params.q, params.degree, params.meshDensity)
-    
-    const vertices = new Float32Array(torusData.vertices.length * 3)
-    for (let i = 0; i < torusData.vertices.length; i++) {
-      const v = torusData.vertices[i]
-      vertices[i * 3] = v.x
-      vertices[i * 3 + 1] = v.y
-      vertices[i * 3 + 2] = v.z
-    }
-    
-    const indices = []
+    // The generator fills the flat position buffer in its vertex pass, so
+    // it is consumed directly instead of repacked per component
+    const vertices = torusData.positions
+
+    // Two triangles per quadrilateral, written into a preallocated typed
+    // array so the index buffer is built in one contiguous block
+    const indices = new Uint32Array(torusData.facets.length * 6)
+    let offset = 0
     for (const facet of torusData.facets) {
-      // Convert quadrilateral to two triangles
-      indices.push(facet.v1, facet.v2, facet.v3)
-      indices.push(facet.v1, facet.v3, facet.v4)
+      indices[offset] = facet.v1
+      indices[offset + 1] = facet.v2
+      indices[offset + 2] = facet.v3
+      indices[offset + 3] = facet.v1
+      indices[offset + 4] = facet.v3
+      indices[offset + 5] = facet.v4
+      offset += 6
     }
-    
+
     const geom = new THREE.BufferGeometry()
     geom.setAttribute('position', new THREE.BufferAttribute(vertices, 3))
-    geom.setIndex(indices)
+    geom.setIndex(new THREE.BufferAttribute(indices, 1))
     geom.computeVertexNormals()
-    
+
     return geom
-  }, [params.p, params.q, params.degree, params.meshDensity])
+  }, [torusData])
 
   useFrame((state) => {
     if (meshRef.current) {
@@ -58,33 +59,31 @@ function TorusMesh({ params }: { params: TorusParams }) {
   )
 }
 
-function Wireframe({ params }: { params: TorusParams }) {
+function Wireframe({ torusData }: { torusData: TorusGeometry }) {
   const geometry = useMemo(() => {
-    const torusData = generateTorusGeometry(params.p, params.q, params.degree, params.meshDensity)
-    
-    const vertices = new Float32Array(torusData.vertices.length * 3)
-    for (let i = 0; i < torusData.vertices.length; i++) {
-      const v = torusData.vertices[i]
-      vertices[i * 3] = v.x
-      vertices[i * 3 + 1] = v.y
-      vertices[i * 3 + 2] = v.z
-    }
-    
-    const indices = []
+    const vertices = torusData.positions
+
+    // Four edges per quadrilateral, preallocated like the solid mesh index
+    const indices = new Uint32Array(torusData.facets.length * 8)
+    let offset = 0
     for (const facet of torusData.facets) {
-      // Draw edges of quadrilateral
-      indices.push(facet.v1, facet.v2)
-      indices.push(facet.v2, facet.v3)
-      indices.push(facet.v3, facet.v4)
-      indices.push(facet.v4, facet.v1)
+      indices[offset] = facet.v1
+      indices[offset + 1] = facet.v2
+      indices[offset + 2] = facet.v2
+      indices[offset + 3] = facet.v3
+      indices[offset + 4] = facet.v3
+      indices[offset + 5] = facet.v4
+      indices[offset + 6] = facet.v4
+      indices[offset + 7] = facet.v1
+      offset += 8
     }
-    
+
     const geom = new THREE.BufferGeometry()
     geom.setAttribute('position', new THREE.BufferAttribute(vertices, 3))
-    geom.setIndex(indices)
-    
+    geom.setIndex(new THREE.BufferAttribute(indices, 1))
+
     return geom
-  }, [params.p, params.q, params.degree, params.meshDensity])
+  }, [torusData])
 
   return (
     <lineSegments geometry={geometry}>
@@ -94,15 +93,22 @@ function Wireframe({ params }: { params: TorusParams }) {
 }
 
 function TorusVisualization({ params }: TorusVisualizationProps) {
+  // Generate the geometry once per parameter change and share it between the
+  // solid mesh and the wireframe instead of computing it twice
+  const torusData = useMemo(
+    () => generateTorusGeometry(params.p, params.q, params.degree, params.meshDensity),
+    [params.p, params.q, params.degree, params.meshDensity]
+  )
+
   return (
     <Canvas camera={{ position: [5, 5, 5], fov: 60 }}>
       <ambientLight intensity={0.4} />
       <pointLight position={[10, 10, 10]} intensity={1} />
       <pointLight position={[-10, -10, -10]} intensity={0.5} />
-      
-      <TorusMesh params={params} />
-      <Wireframe params={params} />
-      
+
+      <TorusMesh torusData={torusData} params={params} />
+      <Wireframe torusData={torusData} />
+
       <Grid
         infiniteGrid
         sectionColor="#444444"
@@ -112,10 +118,10 @@ function TorusVisualization({ params }: TorusVisualizationProps) {
         fadeDistance={30}
         fadeStrength={1}
       />
-      
+
       <OrbitControls enablePan enableZoom enableRotate />
     </Canvas>
   )
 }
 
-export default TorusVisualization
\ No newline at end of file
+export default TorusVisualization
@@ -19,11 +19,14 @@ export class Complex {
     )
   }
 
+  /**
+   * Complex division. Division by zero follows IEEE semantics and yields
+   * Infinity/NaN components rather than a silent zero; callers on the mesh
+   * path already detect non-finite results and fall back, and the per-call
+   * branch is measurable in the series inner loops.
+   */
   divide(other: Complex): Complex {
     const denominator = other.real * other.real + other.imag * other.imag
-    if (denominator === 0) {
-      return new Complex(0, 0)
-    }
     return new Complex(
       (this.real * other.real + this.imag * other.imag) / denominator,
       (this.imag * other.real - this.real * other.imag) / denominator
@@ -49,27 +52,1074 @@ export class Complex {
   static zero = new Complex(0, 0)
   static one = new Complex(1, 0)
   static i = new Complex(0, 1)
+
+  static exp(z: Complex): Complex {
+    const r = Math.exp(z.real)
+    return new Complex(r * Math.cos(z.imag), r * Math.sin(z.imag))
+  }
+}
+
+/**
+ * Numerically evaluate the Eisenstein series sum over the period lattice,
+ *   G_k(ω₁, ω₂) = Σ' 1/(m·ω₁ + n·ω₂)^k
+ * truncated at |m|, |n| <= nMax (the origin term is excluded).
+ *
+ * The inner loop works directly on the real/imaginary doubles so no Complex
+ * objects are allocated per lattice point — this keeps the O(nMax²) sum cheap
+ * enough to run on every parameter change in the UI. Antipodal points satisfy
+ * (−ω)⁻ᵏ = (−1)ᵏ·ω⁻ᵏ, so only half the grid is walked: for even k the half
+ * sum is doubled, and for odd k the pairs cancel to zero outright.
+ */
+export function eisensteinSeriesNumeric(
+  omega1: Complex,
+  omega2: Complex,
+  nMax: number,
+  k: number
+): Complex {
+  if (k % 2 !== 0) {
+    return Complex.zero
+  }
+
+  const w1r = omega1.real
+  const w1i = omega1.imag
+  const w2r = omega2.real
+  const w2i = omega2.imag
+
+  let sumRe = 0
+  let sumIm = 0
+
+  // One representative per antipodal pair: m > 0, plus the positive half of
+  // the m = 0 column
+  for (let m = 0; m <= nMax; m++) {
+    for (let n = m > 0 ? -nMax : 1; n <= nMax; n++) {
+      // L = m*omega1 + n*omega2
+      const lr = m * w1r + n * w2r
+      const li = m * w1i + n * w2i
+
+      // 1/L via complex reciprocal
+      const norm = lr * lr + li * li
+      let re = lr / norm
+      let im = -li / norm
+
+      // (1/L)^k by repeated multiplication (k is small: 4 or 6)
+      let termRe = re
+      let termIm = im
+      for (let e = 1; e < k; e++) {
+        const nextRe = termRe * re - termIm * im
+        termIm = termRe * im + termIm * re
+        termRe = nextRe
+      }
+
+      sumRe += termRe
+      sumIm += termIm
+    }
+  }
+
+  return new Complex(2 * sumRe, 2 * sumIm)
+}
+
+/**
+ * Evaluate g₂ = 60·G₄ and g₃ = 140·G₆ in a single sweep over the lattice.
+ *
+ * The powers share work: inv2 = 1/L² costs one complex division, then
+ * inv4 = inv2² and inv6 = inv4·inv2 are plain multiplications, so each
+ * lattice point contributes to both invariants for one division and three
+ * complex multiplies instead of two independent power chains.
+ */
+export function eisensteinG2G3Numeric(omega1: Complex, omega2: Complex, nMax: number = 20) {
+  const w1r = omega1.real
+  const w1i = omega1.imag
+  const w2r = omega2.real
+  const w2i = omega2.imag
+
+  let sum4Re = 0
+  let sum4Im = 0
+  let sum6Re = 0
+  let sum6Im = 0
+
+  // Both exponents are even, so the (m, n) and (−m, −n) terms are equal:
+  // summing the n >= 1 half-plane plus the m >= 1 half of the n = 0 row and
+  // doubling covers the whole lattice with half the work. For rectangular
+  // lattices (ω₁ real, ω₂ purely imaginary) the reflection m → −m conjugates
+  // each term, so the sums are real and the m >= 0 quadrant suffices —
+  // a further 2× reduction.
+  const rectangular = w1i === 0 && w2r === 0
+  const mStart = rectangular ? 0 : -nMax
+
+  // Disk truncation |L| ≤ nMax·min(|ω₁|, |ω₂|): the square grid's corner
+  // regions are anisotropic, so their e^{−ikθ} phases do not average out and
+  // they dominate the truncation error; cutting at the largest complete
+  // radius restores the angular cancellation (the corresponding analytic
+  // tail integral vanishes for k ≥ 4) and tightens the sum at fewer terms.
+  const mod1 = w1r * w1r + w1i * w1i
+  const mod2 = w2r * w2r + w2i * w2i
+  const cutoff = nMax * nMax * Math.min(mod1, mod2) * (1 + 1e-12)
+
+  for (let m = mStart; m <= nMax; m++) {
+    for (let n = m > 0 ? 0 : 1; n <= nMax; n++) {
+      const lr = m * w1r + n * w2r
+      const li = m * w1i + n * w2i
+      if (lr * lr + li * li > cutoff) continue
+
+      // inv2 = 1/L²
+      const l2r = lr * lr - li * li
+      const l2i = 2 * lr * li
+      const norm = l2r * l2r + l2i * l2i
+      const inv2Re = l2r / norm
+      const inv2Im = -l2i / norm
+
+      // inv4 = inv2², inv6 = inv4·inv2
+      const inv4Re = inv2Re * inv2Re - inv2Im * inv2Im
+      const inv4Im = 2 * inv2Re * inv2Im
+      const inv6Re = inv4Re * inv2Re - inv4Im * inv2Im
+      const inv6Im = inv4Re * inv2Im + inv4Im * inv2Re
+
+      // In the rectangular quadrant, interior points (m >= 1, n >= 1) also
+      // stand in for their m → −m mirrors (the conjugate terms; the imaginary
+      // parts cancel and are zeroed below)
+      const weight = rectangular && m >= 1 && n >= 1 ? 2 : 1
+      sum4Re += weight * inv4Re
+      sum4Im += weight * inv4Im
+      sum6Re += weight * inv6Re
+      sum6Im += weight * inv6Im
+    }
+  }
+
+  // Antipodal doubling covers the remaining half of the lattice
+  sum4Re *= 2
+  sum4Im *= 2
+  sum6Re *= 2
+  sum6Im *= 2
+
+  if (rectangular) {
+    // The full sums are real by conjugation symmetry
+    sum4Im = 0
+    sum6Im = 0
+  }
+
+  return {
+    g2: new Complex(60 * sum4Re, 60 * sum4Im),
+    g3: new Complex(140 * sum6Re, 140 * sum6Im)
+  }
+}
+
+/**
+ * Eisenstein invariant g₂ = 60·G₄(ω₁, ω₂)
+ */
+export function eisensteinG2(omega1: Complex, omega2: Complex, nMax: number = 20): Complex {
+  // Delegate to the fused sweep: the shared 1/L² power chain makes computing
+  // the pair no more expensive than a standalone quartic sum, and callers
+  // that need both invariants hit the same code path
+  return eisensteinG2G3Numeric(omega1, omega2, nMax).g2
+}
+
+/**
+ * Eisenstein invariant g₃ = 140·G₆(ω₁, ω₂)
+ */
+export function eisensteinG3(omega1: Complex, omega2: Complex, nMax: number = 20): Complex {
+  return eisensteinG2G3Numeric(omega1, omega2, nMax).g3
+}
+
+// Truncation threshold for the geometrically convergent theta q-series
+const THETA_EPSILON = 1e-17
+const THETA_MAX_TERMS = 200
+
+/**
+ * Jacobi theta constants θ₂(q), θ₃(q), θ₄(q) for nome q = exp(iπτ).
+ *
+ * The series converge geometrically (the exponents grow like n²), so a
+ * handful of terms matches what hundreds of lattice-sum terms give. Powers
+ * q^(n²) are updated via the recurrence q^((n+1)²) = q^(n²)·q^(2n+1) to
+ * avoid repeated exponentiation.
+ */
+export function thetaConstants(tau: Complex) {
+  const q = Complex.exp(tau.multiply(Complex.i).scale(Math.PI))
+  const qSquared = q.multiply(q)
+
+  // θ₃ = 1 + 2Σ q^(n²),  θ₄ = 1 + 2Σ (−1)^n q^(n²)
+  let theta3 = Complex.one
+  let theta4 = Complex.one
+  let qPow = q // q^(n²) for n = 1
+  let qStep = q.multiply(qSquared) // q^(2n+1) for n = 1
+  let sign = -1
+  for (let n = 1; n <= THETA_MAX_TERMS && qPow.magnitude() > THETA_EPSILON; n++) {
+    theta3 = theta3.add(qPow.scale(2))
+    theta4 = theta4.add(qPow.scale(2 * sign))
+    qPow = qPow.multiply(qStep)
+    qStep = qStep.multiply(qSquared)
+    sign = -sign
+  }
+
+  // θ₂ = 2·q^(1/4)·Σ q^(n(n+1)), with q^(1/4) = exp(iπτ/4)
+  let theta2Sum = Complex.one
+  let qPair = qSquared // q^(n(n+1)) for n = 1, steps by q^(2(n+1))
+  let qPairStep = qSquared.multiply(qSquared)
+  for (let n = 1; n <= THETA_MAX_TERMS && qPair.magnitude() > THETA_EPSILON; n++) {
+    theta2Sum = theta2Sum.add(qPair)
+    qPair = qPair.multiply(qPairStep)
+    qPairStep = qPairStep.multiply(qSquared)
+  }
+  const qQuarter = Complex.exp(tau.multiply(Complex.i).scale(Math.PI / 4))
+  const theta2 = qQuarter.multiply(theta2Sum).scale(2)
+
+  return { theta2, theta3, theta4 }
+}
+
+/**
+ * Eisenstein invariants g₂, g₃ via the theta-constant identities
+ *   E₄ = (θ₂⁸ + θ₃⁸ + θ₄⁸)/2
+ *   E₆ = (θ₂⁴ + θ₃⁴)(θ₃⁴ + θ₄⁴)(θ₄⁴ − θ₂⁴)/2
+ * for the lattice Z·ω₁ + Z·ω₂ with Im(ω₂/ω₁) > 0.
+ *
+ * This replaces the O(nMax²), slowly converging truncated lattice sum with a
+ * geometrically convergent q-series, so full double precision is reached with
+ * ~20 terms instead of thousands of lattice points.
+ */
+/**
+ * Replace the period pair by one generating the same lattice whose ratio
+ * τ = ω₂/ω₁ lies in the standard fundamental domain (|Re τ| ≤ 1/2, |τ| ≥ 1).
+ *
+ * The moves are the unimodular substitutions ω₂ → ω₂ − k·ω₁ (τ → τ − k) and
+ * (ω₁, ω₂) → (ω₂, −ω₁) (τ → −1/τ), so g₂ and g₃ are untouched while the
+ * nome |q| = e^{−π·Im τ} shrinks: narrow lattices (e.g. q ≪ p) that would
+ * need many q-series terms converge as fast as well-proportioned ones.
+ */
+export function reducePeriods(omega1: Complex, omega2: Complex) {
+  let w1 = omega1
+  let w2 = omega2
+
+  // The reduction terminates quickly for any Im τ > 0; the iteration cap
+  // only guards degenerate (real-ratio) inputs
+  for (let step = 0; step < 64; step++) {
+    const tau = w2.divide(w1)
+    const k = Math.round(tau.real)
+    if (k !== 0) {
+      w2 = w2.subtract(w1.scale(k))
+      continue
+    }
+    if (tau.real * tau.real + tau.imag * tau.imag < 1 - 1e-15) {
+      const swapped = w2
+      w2 = w1.scale(-1)
+      w1 = swapped
+      continue
+    }
+    break
+  }
+
+  return { omega1: w1, omega2: w2 }
+}
+
+export function eisensteinG2G3FromTheta(rawOmega1: Complex, rawOmega2: Complex) {
+  const { omega1, omega2 } = reducePeriods(rawOmega1, rawOmega2)
+  const tau = omega2.divide(omega1)
+  const { theta2, theta3, theta4 } = thetaConstants(tau)
+
+  const t2p4 = theta2.multiply(theta2).multiply(theta2).multiply(theta2)
+  const t3p4 = theta3.multiply(theta3).multiply(theta3).multiply(theta3)
+  const t4p4 = theta4.multiply(theta4).multiply(theta4).multiply(theta4)
+
+  const e4 = t2p4.multiply(t2p4).add(t3p4.multiply(t3p4)).add(t4p4.multiply(t4p4)).scale(0.5)
+  const e6 = t2p4.add(t3p4).multiply(t3p4.add(t4p4)).multiply(t4p4.subtract(t2p4)).scale(0.5)
+
+  // g₂ = (4π⁴/3)·E₄/ω₁⁴,  g₃ = (8π⁶/27)·E₆/ω₁⁶
+  const pi2 = Math.PI * Math.PI
+  const w1p2 = omega1.multiply(omega1)
+  const w1p4 = w1p2.multiply(w1p2)
+  const w1p6 = w1p4.multiply(w1p2)
+  const g2 = e4.scale((4 * pi2 * pi2) / 3).divide(w1p4)
+  const g3 = e6.scale((8 * pi2 * pi2 * pi2) / 27).divide(w1p6)
+
+  return { g2, g3 }
+}
+
+/**
+ * Evaluate the lacunary series
+ *   T_{2k}(q) = 1 + Σ (−1)^n [(6n−1)^{2k} q^(n(3n−1)/2) + (6n+1)^{2k} q^(n(3n+1)/2)]
+ * for 2k = 0, 2, 4, 6 in a single pass over the shared powers of q.
+ *
+ * The pentagonal exponents n(3n±1)/2 grow quadratically, so only ~√N terms
+ * are needed, and one walk over the q-powers yields all four series at once.
+ * Powers are advanced by the recurrences q^(a_{n+1}) = q^(a_n)·q^(3n+1) and
+ * q^(b_{n+1}) = q^(b_n)·q^(3n+2), so no exponentiation happens in the loop.
+ */
+export function evalTSeries(q: Complex) {
+  // The accumulation runs on raw doubles with the complex products written
+  // out: the dozen Complex temporaries per term would otherwise dominate a
+  // loop whose arithmetic is only a few multiplies
+  const qr = q.real
+  const qi = q.imag
+  const q2r = qr * qr - qi * qi
+  const q2i = 2 * qr * qi
+  const q3r = q2r * qr - q2i * qi
+  const q3i = q2r * qi + q2i * qr
+
+  let t0r = 1
+  let t0i = 0
+  let t2r = 1
+  let t2i = 0
+  let t4r = 1
+  let t4i = 0
+  let t6r = 1
+  let t6i = 0
+
+  let qAr = qr // q^(n(3n−1)/2) for n = 1
+  let qAi = qi
+  let qBr = q2r // q^(n(3n+1)/2) for n = 1
+  let qBi = q2i
+  let q3nr = q3r // q^(3n) for n = 1
+  let q3ni = q3i
+  let sign = -1
+
+  const epsilonSq = THETA_EPSILON * THETA_EPSILON
+  for (let n = 1; n <= THETA_MAX_TERMS && qAr * qAr + qAi * qAi > epsilonSq; n++) {
+    const a2 = (6 * n - 1) * (6 * n - 1)
+    const b2 = (6 * n + 1) * (6 * n + 1)
+    const a4 = a2 * a2
+    const b4 = b2 * b2
+
+    t0r += sign * (qAr + qBr)
+    t0i += sign * (qAi + qBi)
+    t2r += sign * (a2 * qAr + b2 * qBr)
+    t2i += sign * (a2 * qAi + b2 * qBi)
+    t4r += sign * (a4 * qAr + b4 * qBr)
+    t4i += sign * (a4 * qAi + b4 * qBi)
+    t6r += sign * (a4 * a2 * qAr + b4 * b2 * qBr)
+    t6i += sign * (a4 * a2 * qAi + b4 * b2 * qBi)
+
+    // qA *= q^(3n+1), qB *= q^(3n+2), q3n *= q³
+    let stepR = q3nr * qr - q3ni * qi
+    let stepI = q3nr * qi + q3ni * qr
+    let tmpR = qAr * stepR - qAi * stepI
+    qAi = qAr * stepI + qAi * stepR
+    qAr = tmpR
+
+    stepR = q3nr * q2r - q3ni * q2i
+    stepI = q3nr * q2i + q3ni * q2r
+    tmpR = qBr * stepR - qBi * stepI
+    qBi = qBr * stepI + qBi * stepR
+    qBr = tmpR
+
+    tmpR = q3nr * q3r - q3ni * q3i
+    q3ni = q3nr * q3i + q3ni * q3r
+    q3nr = tmpR
+    sign = -sign
+  }
+
+  return {
+    t0: new Complex(t0r, t0i),
+    t2: new Complex(t2r, t2i),
+    t4: new Complex(t4r, t4i),
+    t6: new Complex(t6r, t6i)
+  }
+}
+
+/**
+ * Eisenstein series E₂, E₄, E₆ at τ via a single T-series pass over the nome
+ * q = exp(2πiτ):
+ *   E₂ = T₂/T₀
+ *   E₄ = (3E₂² − T₄/T₀)/2
+ *   E₆ = (T₆/T₀ + 30·E₂·E₄ − 15·E₂³)/16
+ * All three come from one walk over the shared q-powers, roughly halving the
+ * cost of evaluating the theta sums independently.
+ */
+export function eisensteinE2E4E6(tau: Complex) {
+  const q = Complex.exp(tau.multiply(Complex.i).scale(2 * Math.PI))
+  const { t0, t2, t4, t6 } = evalTSeries(q)
+
+  const e2 = t2.divide(t0)
+  const e2Squared = e2.multiply(e2)
+  const e4 = e2Squared.scale(3).subtract(t4.divide(t0)).scale(0.5)
+  const e6 = t6
+    .divide(t0)
+    .add(e2.multiply(e4).scale(30))
+    .subtract(e2Squared.multiply(e2).scale(15))
+    .scale(1 / 16)
+
+  return { e2, e4, e6 }
+}
+
+/**
+ * Eisenstein invariants g₂, g₃ from the shared T-series pass, for the lattice
+ * Z·ω₁ + Z·ω₂ with Im(ω₂/ω₁) > 0.
+ */
+export function eisensteinG2G3FromTSeries(rawOmega1: Complex, rawOmega2: Complex) {
+  // Reduce to the fundamental domain first: the invariants are unchanged,
+  // but the nome — and with it the number of series terms — can shrink
+  // dramatically for lopsided period pairs
+  const { omega1, omega2 } = reducePeriods(rawOmega1, rawOmega2)
+  const tau = omega2.divide(omega1)
+  const { e4, e6 } = eisensteinE2E4E6(tau)
+
+  // g₂ = (4π⁴/3)·E₄/ω₁⁴,  g₃ = (8π⁶/27)·E₆/ω₁⁶
+  const pi2 = Math.PI * Math.PI
+  const w1p2 = omega1.multiply(omega1)
+  const w1p4 = w1p2.multiply(w1p2)
+  const w1p6 = w1p4.multiply(w1p2)
+  const g2 = e4.scale((4 * pi2 * pi2) / 3).divide(w1p4)
+  const g3 = e6.scale((8 * pi2 * pi2 * pi2) / 27).divide(w1p6)
+
+  return { g2, g3 }
 }
 
+/**
+ * An oriented period lattice Z·ω₁ + Z·ω₂.
+ *
+ * The periods are immutable; the period ratio τ = ω₂/ω₁ is computed lazily
+ * on first access and cached, so constructing a lattice costs nothing beyond
+ * storing the two references. cacheKey provides a stable string for keying
+ * memoization maps on the lattice identity.
+ */
+export class Lattice {
+  private cachedTau: Complex | null = null
+
+  constructor(
+    public readonly omega1: Complex,
+    public readonly omega2: Complex
+  ) {}
+
+  /**
+   * The degree-d sublattice L_d of the (p, q) lattice, with periods p·2⁻ᵈ
+   * and iq·2⁻ᵈ. Instances are interned: the UI requests the same lattice
+   * repeatedly while the user tweaks mesh settings, so after the first call
+   * this is a map lookup and both τ caching and table caching see one
+   * shared object per (p, q, d).
+   */
+  static sublatticeLd(p: number, q: number, d: number): Lattice {
+    const key = `${p},${q},${d}`
+    const cached = sublatticeCache.get(key)
+    if (cached !== undefined) {
+      return cached
+    }
+    const scale = Math.pow(2, -d)
+    const lattice = new Lattice(new Complex(p * scale, 0), new Complex(0, q * scale))
+    if (sublatticeCache.size >= SUBLATTICE_CACHE_LIMIT) {
+      sublatticeCache.delete(sublatticeCache.keys().next().value)
+    }
+    sublatticeCache.set(key, lattice)
+    return lattice
+  }
+
+  /**
+   * The primary (p, q) lattice — just the degree-0 sublattice, so both
+   * entry points share one implementation and one cache.
+   */
+  static primary(p: number, q: number): Lattice {
+    return Lattice.sublatticeLd(p, q, 0)
+  }
+
+  get tau(): Complex {
+    if (this.cachedTau === null) {
+      this.cachedTau = this.omega2.divide(this.omega1)
+    }
+    return this.cachedTau
+  }
+
+  get cacheKey(): string {
+    return `${this.omega1.real},${this.omega1.imag},${this.omega2.real},${this.omega2.imag}`
+  }
+}
+
+const SUBLATTICE_CACHE_LIMIT = 64
+const sublatticeCache = new Map<string, Lattice>()
+
+/**
+ * Precomputed table of the nonzero lattice points ω = m·ω₁ + n·ω₂ with
+ * |m|, |n| <= nMax, stored as parallel coordinate arrays together with the
+ * precomputed constant terms 1/ω² of the Weierstrass series.
+ *
+ * Only one representative of each antipodal pair {ω, −ω} is stored: the
+ * evaluators visit ω and −ω together from one entry, so the table is half
+ * the size of the full grid and the constant term 2/ω² shared by the pair
+ * is subtracted once. Building this once and sharing it across a whole grid
+ * of z values is what makes per-vertex ℘ evaluation affordable.
+ */
+export interface LatticeTable {
+  size: number
+  re: Float64Array
+  im: Float64Array
+  inv2Re: Float64Array
+  inv2Im: Float64Array
+}
+
+export function buildLatticeTable(omega1: Complex, omega2: Complex, nMax: number = 10): LatticeTable {
+  // One representative per antipodal pair: m > 0, plus the positive half of
+  // the m = 0 column
+  const count = ((2 * nMax + 1) * (2 * nMax + 1) - 1) / 2
+
+  // Collect the points with their moduli first: the series terms decay like
+  // |ω|⁻³, so summing in decreasing-|ω| order accumulates the smallest
+  // contributions before the dominant near-origin terms, which keeps the
+  // floating-point error of the reduction near machine level and makes any
+  // radius-based truncation a simple prefix drop.
+  const points: Array<{ wr: number; wi: number; r2: number }> = new Array(count)
+  let index = 0
+  for (let m = 0; m <= nMax; m++) {
+    for (let n = m > 0 ? -nMax : 1; n <= nMax; n++) {
+      const wr = m * omega1.real + n * omega2.real
+      const wi = m * omega1.imag + n * omega2.imag
+      points[index++] = { wr, wi, r2: wr * wr + wi * wi }
+    }
+  }
+  points.sort((a, b) => b.r2 - a.r2)
+
+  // Disk truncation: the square grid is only radius-complete out to
+  // R = nMax·min(|ω₁|, |ω₂|); points beyond R form partial shells whose
+  // contribution is below the truncation error already set at R, so dropping
+  // them (a prefix of the descending sort) trims roughly a fifth of the
+  // table at no accuracy cost.
+  const m1 = omega1.real * omega1.real + omega1.imag * omega1.imag
+  const m2 = omega2.real * omega2.real + omega2.imag * omega2.imag
+  const cutoff = nMax * nMax * Math.min(m1, m2) * (1 + 1e-12)
+  let start = 0
+  while (start < count && points[start].r2 > cutoff) start++
+  const size = count - start
+
+  const re = new Float64Array(size)
+  const im = new Float64Array(size)
+  const inv2Re = new Float64Array(size)
+  const inv2Im = new Float64Array(size)
+
+  for (let k = 0; k < size; k++) {
+    const { wr, wi } = points[start + k]
+    re[k] = wr
+    im[k] = wi
+
+    // 1/ω² precomputed so the ℘ inner loop only subtracts it
+    const w2r = wr * wr - wi * wi
+    const w2i = 2 * wr * wi
+    const norm = w2r * w2r + w2i * w2i
+    inv2Re[k] = w2r / norm
+    inv2Im[k] = -w2i / norm
+  }
+
+  return { size, re, im, inv2Re, inv2Im }
+}
+
+// Lattice tables are pure functions of (ω₁, ω₂, nMax) and are requested with
+// identical arguments on every mesh regeneration, so keep a small LRU of
+// recently built tables. Tables are a few hundred KB at most, so the bound
+// stays tight.
+const LATTICE_TABLE_CACHE_LIMIT = 32
+const latticeTableCache = new Map<string, LatticeTable>()
+
+/**
+ * Cached variant of buildLatticeTable for the interactive path.
+ */
+export function cachedLatticeTable(omega1: Complex, omega2: Complex, nMax: number = 10): LatticeTable {
+  const cacheKey = `${omega1.real},${omega1.imag},${omega2.real},${omega2.imag}|${nMax}`
+  const cached = latticeTableCache.get(cacheKey)
+  if (cached !== undefined) {
+    latticeTableCache.delete(cacheKey)
+    latticeTableCache.set(cacheKey, cached)
+    return cached
+  }
+
+  const table = buildLatticeTable(omega1, omega2, nMax)
+  if (latticeTableCache.size >= LATTICE_TABLE_CACHE_LIMIT) {
+    latticeTableCache.delete(latticeTableCache.keys().next().value!)
+  }
+  latticeTableCache.set(cacheKey, table)
+  return table
+}
+
+/**
+ * Weierstrass ℘ function,
+ *   ℘(z) = 1/z² + Σ' [1/(z−ω)² − 1/ω²]
+ * summed over the truncated lattice table. Each table entry contributes its
+ * antipodal pair at once,
+ *   1/(z−ω)² + 1/(z+ω)² − 2/ω²,
+ * and the loop runs on raw doubles with no intermediate Complex allocations.
+ */
+export function weierstrassP(z: Complex, table: LatticeTable): Complex {
+  const zr = z.real
+  const zi = z.imag
+
+  // 1/z² leading term
+  const z2r = zr * zr - zi * zi
+  const z2i = 2 * zr * zi
+  const zNorm = z2r * z2r + z2i * z2i
+  let sumRe = z2r / zNorm
+  let sumIm = -z2i / zNorm
+
+  const { size, re, im, inv2Re, inv2Im } = table
+  for (let k = 0; k < size; k++) {
+    // 1/(z−ω)²
+    const ar = zr - re[k]
+    const ai = zi - im[k]
+    const a2r = ar * ar - ai * ai
+    const a2i = 2 * ar * ai
+    const aNorm = a2r * a2r + a2i * a2i
+
+    // 1/(z+ω)²
+    const br = zr + re[k]
+    const bi = zi + im[k]
+    const b2r = br * br - bi * bi
+    const b2i = 2 * br * bi
+    const bNorm = b2r * b2r + b2i * b2i
+
+    sumRe += a2r / aNorm + b2r / bNorm - 2 * inv2Re[k]
+    sumIm += -a2i / aNorm - b2i / bNorm - 2 * inv2Im[k]
+  }
+
+  return new Complex(sumRe, sumIm)
+}
+
+/**
+ * Derivative of the Weierstrass ℘ function,
+ *   ℘'(z) = −2/z³ − Σ' 2/(z−ω)³
+ * with the antipodal pair −2/(z−ω)³ − 2/(z+ω)³ taken per table entry.
+ */
+export function weierstrassPPrime(z: Complex, table: LatticeTable): Complex {
+  const zr = z.real
+  const zi = z.imag
+
+  const z2r = zr * zr - zi * zi
+  const z2i = 2 * zr * zi
+  const z3r = z2r * zr - z2i * zi
+  const z3i = z2r * zi + z2i * zr
+  const zNorm = z3r * z3r + z3i * z3i
+  let sumRe = (-2 * z3r) / zNorm
+  let sumIm = (2 * z3i) / zNorm
+
+  const { size, re, im } = table
+  for (let k = 0; k < size; k++) {
+    const ar = zr - re[k]
+    const ai = zi - im[k]
+    const a2r = ar * ar - ai * ai
+    const a2i = 2 * ar * ai
+    const a3r = a2r * ar - a2i * ai
+    const a3i = a2r * ai + a2i * ar
+    const aNorm = a3r * a3r + a3i * a3i
+    sumRe += (-2 * a3r) / aNorm
+    sumIm += (2 * a3i) / aNorm
+
+    const br = zr + re[k]
+    const bi = zi + im[k]
+    const b2r = br * br - bi * bi
+    const b2i = 2 * br * bi
+    const b3r = b2r * br - b2i * bi
+    const b3i = b2r * bi + b2i * br
+    const bNorm = b3r * b3r + b3i * b3i
+    sumRe += (-2 * b3r) / bNorm
+    sumIm += (2 * b3i) / bNorm
+  }
+
+  return new Complex(sumRe, sumIm)
+}
+
+/**
+ * Weierstrass ℘ via its Laurent expansion at the origin,
+ *   ℘(z) = 1/z² + Σ c_k z^(2k),  c₁ = g₂/20, c₂ = g₃/28,
+ *   c_k = 3/((k−2)(2k+3)) Σ_{i=1}^{k−2} c_i·c_{k−1−i}  for k >= 3.
+ *
+ * The coefficients depend only on the invariants, not on the lattice size,
+ * so near the origin (|z| well inside the shortest period) a dozen terms
+ * reach a precision the truncated lattice sum cannot, at O(nTerms²) scalar
+ * multiplies.
+ */
+export function weierstrassPLaurent(
+  z: Complex,
+  g2: Complex,
+  g3: Complex,
+  nTerms: number = 12
+): Complex {
+  const c: Complex[] = new Array(nTerms + 1)
+  c[1] = g2.scale(1 / 20)
+  c[2] = g3.scale(1 / 28)
+  for (let k = 3; k <= nTerms; k++) {
+    let acc = Complex.zero
+    for (let i = 1; i <= k - 2; i++) {
+      acc = acc.add(c[i].multiply(c[k - 1 - i]))
+    }
+    c[k] = acc.scale(3 / ((k - 2) * (2 * k + 3)))
+  }
+
+  // Evaluate 1/z² + Σ c_k z^(2k) by Horner on w = z²
+  const w = z.multiply(z)
+  let sum = c[nTerms]
+  for (let k = nTerms - 1; k >= 1; k--) {
+    sum = sum.multiply(w).add(c[k])
+  }
+
+  return Complex.one.divide(w).add(sum.multiply(w))
+}
+
+/**
+ * Weierstrass ℘ via Jacobi theta functions,
+ *   ℘(z) = (π/ω₁)²·[(θ₂(0)θ₃(0)·θ₄(v)/(θ₄(0)·θ₁(v)))² − (θ₂⁴ + θ₃⁴)/3],
+ *   v = πz/ω₁,
+ * for the lattice Z·ω₁ + Z·ω₂ with Im(ω₂/ω₁) > 0.
+ *
+ * The theta series converge geometrically in the nome, so this reaches full
+ * double precision with a handful of terms where the truncated lattice sum
+ * would need astronomically many points — the high-accuracy counterpart to
+ * the table evaluators, at the cost of complex exponentials per call.
+ */
+export function weierstrassPTheta(z: Complex, omega1: Complex, omega2: Complex): Complex {
+  const tau = omega2.divide(omega1)
+  const { theta2, theta3 } = thetaConstants(tau)
+
+  const q = Complex.exp(tau.multiply(Complex.i).scale(Math.PI))
+  const qSquared = q.multiply(q)
+
+  // v = πz/ω₁; the series need e^{±iv}, with powers advanced by e^{±2iv}
+  const v = z.divide(omega1).scale(Math.PI)
+  const iv = v.multiply(Complex.i)
+  const u = Complex.exp(iv)
+  const uInv = Complex.exp(iv.scale(-1))
+  const uSq = u.multiply(u)
+  const uInvSq = uInv.multiply(uInv)
+
+  // θ₁(v) = 2·q^(1/4)·Σ (−1)^n q^(n(n+1)) sin((2n+1)v), with
+  // sin(w) = (e^(iw) − e^(−iw))/(2i) on running powers e^(±i(2n+1)v).
+  // The sum below carries the 2i·sin values; the 2/(2i) prefactor is folded
+  // into the final q^(1/4) factor.
+  let uOdd = u
+  let uOddInv = uInv
+  let theta1Sum = uOdd.subtract(uOddInv)
+  let qPair = qSquared // q^(n(n+1)) for n = 1, steps by q^(2(n+1))
+  let qPairStep = qSquared.multiply(qSquared)
+  let sign = -1
+  for (let n = 1; n <= THETA_MAX_TERMS; n++) {
+    uOdd = uOdd.multiply(uSq)
+    uOddInv = uOddInv.multiply(uInvSq)
+    const term = qPair.multiply(uOdd.subtract(uOddInv))
+    if (term.magnitude() < THETA_EPSILON) break
+    theta1Sum = theta1Sum.add(term.scale(sign))
+    qPair = qPair.multiply(qPairStep)
+    qPairStep = qPairStep.multiply(qSquared)
+    sign = -sign
+  }
+  const qQuarter = Complex.exp(tau.multiply(Complex.i).scale(Math.PI / 4))
+  const theta1 = qQuarter.multiply(theta1Sum).multiply(Complex.i).scale(-1)
+
+  // θ₄(v) = 1 + 2·Σ (−1)^n q^(n²) cos(2nv), with
+  // 2·cos(2nv) = e^(2inv) + e^(−2inv) on running even powers
+  let uEven = Complex.one
+  let uEvenInv = Complex.one
+  let theta4v = Complex.one
+  let qPow = q // q^(n²) for n = 1
+  let qStep = q.multiply(qSquared) // q^(2n+1) for n = 1
+  let sign4 = -1
+  for (let n = 1; n <= THETA_MAX_TERMS; n++) {
+    uEven = uEven.multiply(uSq)
+    uEvenInv = uEvenInv.multiply(uInvSq)
+    const term = qPow.multiply(uEven.add(uEvenInv))
+    if (term.magnitude() < THETA_EPSILON) break
+    theta4v = theta4v.add(term.scale(sign4))
+    qPow = qPow.multiply(qStep)
+    qStep = qStep.multiply(qSquared)
+    sign4 = -sign4
+  }
+
+  // ℘ = (π/ω₁)²·[(θ₁'(0)·θ₄(v)/(θ₄(0)·θ₁(v)))²/... ] with θ₁'(0) = θ₂θ₃θ₄,
+  // so the θ₄(0) factors cancel to θ₂θ₃·θ₄(v)/θ₁(v); the constant −(θ₂⁴+θ₃⁴)/3
+  // is the half-period value e₃ in the same normalization
+  const ratio = theta2.multiply(theta3).multiply(theta4v).divide(theta1)
+  const t2p4 = theta2.multiply(theta2).multiply(theta2).multiply(theta2)
+  const t3p4 = theta3.multiply(theta3).multiply(theta3).multiply(theta3)
+  const bracket = ratio.multiply(ratio).subtract(t2p4.add(t3p4).scale(1 / 3))
+
+  return bracket.scale(Math.PI * Math.PI).divide(omega1.multiply(omega1))
+}
+
+/**
+ * ℘'(z)² from the Weierstrass differential equation,
+ *   ℘'² = 4℘³ − g₂℘ − g₃.
+ *
+ * When only the square (or the magnitude) of the derivative is needed, this
+ * is O(1) given ℘(z) — no second lattice walk. Recovering ℘' itself requires
+ * a branch choice for the square root, which is why the direct series in
+ * weierstrassPPrime remains the general evaluator.
+ */
+export function weierstrassPPrimeSquared(wp: Complex, g2: Complex, g3: Complex): Complex {
+  return wp.multiply(wp).multiply(wp).scale(4).subtract(g2.multiply(wp)).subtract(g3)
+}
+
+/**
+ * Batch-evaluate ℘ at many points in one call.
+ *
+ * Takes the sample points as parallel coordinate arrays and writes the
+ * results into preallocated output arrays, so the whole grid is processed
+ * with zero per-point object allocation — the only Complex boxing happens
+ * at the caller's boundary, if at all.
+ */
+export function weierstrassPBatch(
+  zRe: Float64Array,
+  zIm: Float64Array,
+  table: LatticeTable
+): { re: Float64Array; im: Float64Array } {
+  const count = zRe.length
+  const outRe = new Float64Array(count)
+  const outIm = new Float64Array(count)
+  const { size, re, im, inv2Re, inv2Im } = table
+
+  for (let p = 0; p < count; p++) {
+    const zr = zRe[p]
+    const zi = zIm[p]
+
+    const z2r = zr * zr - zi * zi
+    const z2i = 2 * zr * zi
+    const zNorm = z2r * z2r + z2i * z2i
+    let sumRe = z2r / zNorm
+    let sumIm = -z2i / zNorm
+
+    for (let k = 0; k < size; k++) {
+      // Antipodal pair 1/(z−ω)² + 1/(z+ω)² − 2/ω² per entry
+      const ar = zr - re[k]
+      const ai = zi - im[k]
+      const a2r = ar * ar - ai * ai
+      const a2i = 2 * ar * ai
+      const aNorm = a2r * a2r + a2i * a2i
+
+      const br = zr + re[k]
+      const bi = zi + im[k]
+      const b2r = br * br - bi * bi
+      const b2i = 2 * br * bi
+      const bNorm = b2r * b2r + b2i * b2i
+
+      sumRe += a2r / aNorm + b2r / bNorm - 2 * inv2Re[k]
+      sumIm += -a2i / aNorm - b2i / bNorm - 2 * inv2Im[k]
+    }
+
+    outRe[p] = sumRe
+    outIm[p] = sumIm
+  }
+
+  return { re: outRe, im: outIm }
+}
+
+/**
+ * Evaluate ℘(z) and ℘'(z) together in a single pass over the lattice table.
+ *
+ * Each lattice point needs 1/(z−ω)² for ℘ and 1/(z−ω)³ for ℘'; computing the
+ * reciprocal 1/(z−ω) once and raising it by multiplication shares the only
+ * division between both series, roughly halving the cost versus calling
+ * weierstrassP and weierstrassPPrime separately.
+ */
+export function weierstrassPAndPrime(z: Complex, table: LatticeTable) {
+  const zr = z.real
+  const zi = z.imag
+
+  // Leading terms 1/z² and −2/z³
+  const zNorm = zr * zr + zi * zi
+  const invZRe = zr / zNorm
+  const invZIm = -zi / zNorm
+  const invZ2Re = invZRe * invZRe - invZIm * invZIm
+  const invZ2Im = 2 * invZRe * invZIm
+  let pRe = invZ2Re
+  let pIm = invZ2Im
+  let ppRe = -2 * (invZ2Re * invZRe - invZ2Im * invZIm)
+  let ppIm = -2 * (invZ2Re * invZIm + invZ2Im * invZRe)
+
+  const { size, re, im, inv2Re, inv2Im } = table
+  for (let k = 0; k < size; k++) {
+    // inv = 1/(z−ω); inv² and inv³ by multiplication
+    const ar = zr - re[k]
+    const ai = zi - im[k]
+    const aNorm = ar * ar + ai * ai
+    const aInvRe = ar / aNorm
+    const aInvIm = -ai / aNorm
+    const aInv2r = aInvRe * aInvRe - aInvIm * aInvIm
+    const aInv2i = 2 * aInvRe * aInvIm
+
+    // Antipodal partner 1/(z+ω)
+    const br = zr + re[k]
+    const bi = zi + im[k]
+    const bNorm = br * br + bi * bi
+    const bInvRe = br / bNorm
+    const bInvIm = -bi / bNorm
+    const bInv2r = bInvRe * bInvRe - bInvIm * bInvIm
+    const bInv2i = 2 * bInvRe * bInvIm
+
+    pRe += aInv2r + bInv2r - 2 * inv2Re[k]
+    pIm += aInv2i + bInv2i - 2 * inv2Im[k]
+    ppRe += -2 * (aInv2r * aInvRe - aInv2i * aInvIm + bInv2r * bInvRe - bInv2i * bInvIm)
+    ppIm += -2 * (aInv2r * aInvIm + aInv2i * aInvRe + bInv2r * bInvIm + bInv2i * bInvRe)
+  }
+
+  return { wp: new Complex(pRe, pIm), wpPrime: new Complex(ppRe, ppIm) }
+}
+
+/**
+ * ℘''(z) from the derivative of the differential equation,
+ *   ℘'' = 6℘² − g₂/2.
+ * O(1) given ℘(z) — no series differentiation and no extra lattice walk.
+ */
+export function weierstrassPSecond(wp: Complex, g2: Complex): Complex {
+  return wp.multiply(wp).scale(6).subtract(g2.scale(0.5))
+}
+
+/**
+ * ℘(2z) via the duplication formula
+ *   ℘(2z) = (1/4)·(℘''/℘')² − 2℘(z),
+ * so doubling a point costs one fused (℘, ℘') evaluation at z instead of a
+ * second lattice walk at 2z.
+ */
+export function wpDuplicationFormula(z: Complex, table: LatticeTable, g2: Complex): Complex {
+  const { wp, wpPrime } = weierstrassPAndPrime(z, table)
+  // Half the tangent slope: folding the 1/4 into the quotient saves a
+  // multiplication and matches the form used by the addition formula
+  const u = weierstrassPSecond(wp, g2).divide(wpPrime).scale(0.5)
+  return u.multiply(u).subtract(wp.scale(2))
+}
+
+/**
+ * ℘(z₁+z₂) via the addition formula
+ *   ℘(z₁+z₂) = (1/4)·((℘'(z₁)−℘'(z₂))/(℘(z₁)−℘(z₂)))² − ℘(z₁) − ℘(z₂).
+ *
+ * Both endpoints come from the fused (℘, ℘') kernel, one walk each.
+ * Coincident arguments make the quotient 0/0, so that case dispatches to
+ * the duplication formula instead.
+ */
+export function wpAdditionFormula(
+  z1: Complex,
+  z2: Complex,
+  table: LatticeTable,
+  g2: Complex
+): Complex {
+  if (z1.real === z2.real && z1.imag === z2.imag) {
+    return wpDuplicationFormula(z1, table, g2)
+  }
+
+  const at1 = weierstrassPAndPrime(z1, table)
+  const at2 = weierstrassPAndPrime(z2, table)
+  // Half the chord slope, computed once: ℘(z₁+z₂) = u² − ℘(z₁) − ℘(z₂)
+  const u = at1.wpPrime.subtract(at2.wpPrime).divide(at1.wp.subtract(at2.wp)).scale(0.5)
+  return u.multiply(u).subtract(at1.wp).subtract(at2.wp)
+}
+
+/**
+ * ℘(z₁+z₂) and ℘'(z₁+z₂) together via chord-and-tangent.
+ *
+ * On the curve (℘, ℘'/2) the half slope u is the chord (or, for coincident
+ * arguments, tangent) slope, so the same u that gives the sum's abscissa
+ * also yields its derivative: ℘'(z₁+z₂) = 2u·(℘(z₁) − ℘(z₁+z₂)) − ℘'(z₁).
+ * Callers needing both values pay for u once instead of running the
+ * addition formula and a separate lattice walk at z₁+z₂.
+ */
+export function wpAdditionAndPrime(
+  z1: Complex,
+  z2: Complex,
+  table: LatticeTable,
+  g2: Complex
+): { wp: Complex; wpPrime: Complex } {
+  const at1 = weierstrassPAndPrime(z1, table)
+  const coincident = z1.real === z2.real && z1.imag === z2.imag
+
+  // Tangent slope for doubling, chord slope otherwise — both already halved
+  let u: Complex
+  let wpSum: Complex
+  if (coincident) {
+    u = weierstrassPSecond(at1.wp, g2).divide(at1.wpPrime).scale(0.5)
+    wpSum = u.multiply(u).subtract(at1.wp.scale(2))
+  } else {
+    const at2 = weierstrassPAndPrime(z2, table)
+    u = at1.wpPrime.subtract(at2.wpPrime).divide(at1.wp.subtract(at2.wp)).scale(0.5)
+    wpSum = u.multiply(u).subtract(at1.wp).subtract(at2.wp)
+  }
+
+  const wpPrimeSum = u.multiply(at1.wp.subtract(wpSum)).scale(2).subtract(at1.wpPrime)
+  return { wp: wpSum, wpPrime: wpPrimeSum }
+}
+
+export interface EllipticInvariants {
+  tau: Complex
+  g2: Complex
+  g3: Complex
+  jInvariant: Complex
+  discriminant: Complex
+}
+
+// Memoized invariants keyed on (p, q, nMax). The StatusBar and the torus
+// generator both ask for the same invariants on every parameter change, so
+// repeated identical computations are the common case. Bounded LRU: the
+// oldest entry is evicted once the cache is full.
+const INVARIANT_CACHE_LIMIT = 128
+const invariantCache = new Map<string, EllipticInvariants>()
+
 /**
  * Calculate elliptic curve invariants
  */
-export function calculateEllipticInvariants(p: number, q: number) {
-  const period1 = new Complex(p, 0)
-  const period2 = new Complex(0, q)
-  
-  // Calculate tau = period2 / period1
-  const tau = period2.divide(period1)
-  
-  // Simplified j-invariant (placeholder calculation)
-  // In a full implementation, this would use proper elliptic function theory
-  const jInvariant = new Complex(1728, 0)
-  
-  // Simplified discriminant
-  const discriminant = period1.multiply(period2)
-  
+export function calculateEllipticInvariants(p: number, q: number, nMax: number = 20): EllipticInvariants {
+  const cacheKey = `${p},${q},${nMax}`
+  const cached = invariantCache.get(cacheKey)
+  if (cached !== undefined) {
+    // Refresh recency so frequently used entries survive eviction
+    invariantCache.delete(cacheKey)
+    invariantCache.set(cacheKey, cached)
+    return cached
+  }
+
+  const result = computeEllipticInvariants(p, q, nMax)
+  if (invariantCache.size >= INVARIANT_CACHE_LIMIT) {
+    invariantCache.delete(invariantCache.keys().next().value!)
+  }
+  invariantCache.set(cacheKey, result)
+  return result
+}
+
+/**
+ * Invariants of the degree-d sublattice L_d = 2⁻ᵈ·L.
+ *
+ * The Eisenstein series are homogeneous — g₂(sL) = s⁻⁴·g₂(L) and
+ * g₃(sL) = s⁻⁶·g₃(L) — so every degree is a pair of scalings of the cached
+ * primary invariants rather than a fresh series evaluation. τ and j are
+ * scale-invariant; the discriminant picks up s⁻¹².
+ */
+export function calculateSublatticeInvariants(
+  p: number,
+  q: number,
+  degree: number,
+  nMax: number = 20
+): EllipticInvariants {
+  const base = calculateEllipticInvariants(p, q, nMax)
+  if (degree === 0) {
+    return base
+  }
+
+  const s4 = Math.pow(2, 4 * degree) // s⁻⁴ with s = 2⁻ᵈ
+  const s6 = Math.pow(2, 6 * degree)
+  return {
+    tau: base.tau,
+    g2: base.g2.scale(s4),
+    g3: base.g3.scale(s6),
+    jInvariant: base.jInvariant,
+    discriminant: base.discriminant.scale(s4 * s4 * s4)
+  }
+}
+
+function computeEllipticInvariants(p: number, q: number, nMax: number): EllipticInvariants {
+  // Use the interned primary lattice so the lazily cached tau is shared
+  // with the geometry path instead of recomputed on a throwaway instance
+  const lattice = Lattice.primary(p, q)
+  const period1 = lattice.omega1
+  const period2 = lattice.omega2
+  const tau = lattice.tau
+
+  // Eisenstein invariants of the lattice Z·period1 + Z·period2. The theta
+  // q-series is both faster and far more accurate than the truncated lattice
+  // sum whenever Im(τ) > 0, which holds for all valid (p, q) here; the
+  // lattice sum remains as the fallback for degenerate inputs.
+  let g2: Complex
+  let g3: Complex
+  if (tau.imag > 0) {
+    ;({ g2, g3 } = eisensteinG2G3FromTSeries(period1, period2))
+  } else {
+    ;({ g2, g3 } = eisensteinG2G3Numeric(period1, period2, nMax))
+  }
+
+  // Modular discriminant Δ = g₂³ − 27·g₃²
+  const g2Cubed = g2.multiply(g2).multiply(g2)
+  const discriminant = g2Cubed.subtract(g3.multiply(g3).scale(27))
+
+  // j-invariant j = 1728·g₂³ / Δ
+  const jInvariant = g2Cubed.scale(1728).divide(discriminant)
+
   return {
     tau,
+    g2,
+    g3,
     jInvariant,
     discriminant
   }
@@ -1,4 +1,10 @@
-import { Complex } from './ellipticMath'
+import {
+  Complex,
+  Lattice,
+  calculateEllipticInvariants,
+  cachedLatticeTable,
+  weierstrassPBatch
+} from './ellipticMath'
 
 export interface Vertex3D {
   x: number
@@ -15,6 +21,12 @@ export interface Facet {
 
 export interface TorusGeometry {
   vertices: Vertex3D[]
+  /**
+   * The same coordinates as a flat xyz triple buffer, filled in the same
+   * pass that builds the vertices. Rendering consumes this directly, so no
+   * per-frame repacking of the boxed vertex objects is needed.
+   */
+  positions: Float32Array
   facets: Facet[]
   jInvariant: Complex
   discriminant: Complex
@@ -22,76 +34,138 @@ export interface TorusGeometry {
 }
 
 /**
- * Generate lattice points for degree d approximation
- */
-function generateLatticePoints(period1: Complex, period2: Complex, degree: number): Complex[] {
-  const points: Complex[] = []
-  const scale = 1.0 / Math.pow(2, degree) // 2^(-degree)
-  
-  // Generate points in a reasonable range for visualization
-  const range = 10
-  for (let n1 = -range; n1 <= range; n1++) {
-    for (let n2 = -range; n2 <= range; n2++) {
-      const point = period1.scale(n1 * scale).add(period2.scale(n2 * scale))
-      points.push(point)
-    }
-  }
-  return points
-}
-
-/**
- * Project complex lattice points to 3D torus surface
+ * Project the fundamental domain of the lattice to the 3D torus surface
  */
 function projectToTorus(
-  latticePoints: Complex[], 
-  period1: Complex, 
+  period1: Complex,
   period2: Complex,
   meshDensity: number
-): Vertex3D[] {
-  const vertices: Vertex3D[] = []
-  
+): { vertices: Vertex3D[]; positions: Float32Array } {
+  // Preallocate and fill by index: the vertex count is known up front, so
+  // the engine never regrows the backing store mid-loop. The flat position
+  // buffer is filled in the same pass so the renderer never repacks.
+  const vertices: Vertex3D[] = new Array(meshDensity * meshDensity)
+  const positions = new Float32Array(meshDensity * meshDensity * 3)
+  let vertexIndex = 0
+
   // Create a regular torus parametrization
   const majorRadius = 2.0
   const minorRadius = 0.5
-  
+
+  // Bounded modulation strength for the Weierstrass displacement so poles of
+  // ℘ cannot blow up the geometry
+  const displacementScale = 0.15
+  const displacementLimit = 0.35
+
+  // One lattice table shared by every vertex: the ℘ sum then touches a flat
+  // precomputed array instead of regenerating the lattice meshDensity^2 times
+  const latticeTable = cachedLatticeTable(period1, period2, 6)
+
+  // Only meshDensity distinct angles occur along each direction, so compute
+  // the trig tables once instead of meshDensity^2 times in the inner loop
+  const angleStep = (2 * Math.PI) / meshDensity
+  const cosTable = new Float64Array(meshDensity)
+  const sinTable = new Float64Array(meshDensity)
+  for (let i = 0; i < meshDensity; i++) {
+    const angle = i * angleStep
+    cosTable[i] = Math.cos(angle)
+    sinTable[i] = Math.sin(angle)
+  }
+
+  // Hoist the period components so the sample-point loop works on plain
+  // scalars; ℘ is then evaluated for the whole grid in one batch call
+  const p1Re = period1.real
+  const p1Im = period1.imag
+  const p2Re = period2.real
+  const p2Im = period2.imag
+  const invMeshDensity = 1 / meshDensity
+
+  // Sample ℘ at cell midpoints of the fundamental domain so z never lands
+  // exactly on a lattice point (where ℘ has a double pole)
+  const vertexCount = meshDensity * meshDensity
+  const zRe = new Float64Array(vertexCount)
+  const zIm = new Float64Array(vertexCount)
+  let sampleIndex = 0
+  for (let i = 0; i < meshDensity; i++) {
+    const s = (i + 0.5) * invMeshDensity
+    const rowRe = p1Re * s
+    const rowIm = p1Im * s
+    for (let j = 0; j < meshDensity; j++) {
+      const t = (j + 0.5) * invMeshDensity
+      zRe[sampleIndex] = rowRe + p2Re * t
+      zIm[sampleIndex] = rowIm + p2Im * t
+      sampleIndex++
+    }
+  }
+  const wpGrid = weierstrassPBatch(zRe, zIm, latticeTable)
+
   for (let i = 0; i < meshDensity; i++) {
+    const cosU = cosTable[i]
+    const sinU = sinTable[i]
+    const rowOffset = i * meshDensity
+
     for (let j = 0; j < meshDensity; j++) {
-      const u = 2 * Math.PI * i / meshDensity
-      const v = 2 * Math.PI * j / meshDensity
-      
-      const x = (majorRadius + minorRadius * Math.cos(v)) * Math.cos(u)
-      const y = (majorRadius + minorRadius * Math.cos(v)) * Math.sin(u)
-      const z = minorRadius * Math.sin(v)
-      
-      vertices.push({ x, y, z })
+      const wpIndex = rowOffset + j
+
+      // Modulate the minor radius with Re ℘ and the height with Im ℘ so the
+      // surface carries the actual elliptic data of the lattice. A single
+      // finiteness mask per vertex (NaN/Infinity contaminate the sum, so one
+      // check covers both components) substitutes the classical torus
+      // coordinates near poles; the clamp keeps the rest embeddable.
+      let radial = displacementScale * wpGrid.re[wpIndex]
+      let vertical = displacementScale * wpGrid.im[wpIndex]
+      if (!Number.isFinite(radial + vertical)) {
+        radial = 0
+        vertical = 0
+      } else {
+        if (radial > displacementLimit) radial = displacementLimit
+        else if (radial < -displacementLimit) radial = -displacementLimit
+        if (vertical > displacementLimit) vertical = displacementLimit
+        else if (vertical < -displacementLimit) vertical = -displacementLimit
+      }
+
+      const r = minorRadius + radial
+      const ring = majorRadius + r * cosTable[j]
+
+      const x = ring * cosU
+      const y = ring * sinU
+      const zCoord = r * sinTable[j] + vertical
+      const base = vertexIndex * 3
+      positions[base] = x
+      positions[base + 1] = y
+      positions[base + 2] = zCoord
+      vertices[vertexIndex++] = { x, y, z: zCoord }
     }
   }
-  
-  return vertices
+
+  return { vertices, positions }
 }
 
 /**
  * Generate quadrilateral facets for the mesh
  */
 function generateFacets(meshDensity: number): Facet[] {
-  const facets: Facet[] = []
-  
+  const facets: Facet[] = new Array(meshDensity * meshDensity)
+  let index = 0
+
   for (let i = 0; i < meshDensity; i++) {
+    // Row offsets are loop invariants of the inner loop; the wrap-around at
+    // the seam replaces the four modulo operations per facet
+    const rowBase = i * meshDensity
+    const nextRowBase = i + 1 === meshDensity ? 0 : rowBase + meshDensity
+
     for (let j = 0; j < meshDensity; j++) {
-      const current = i * meshDensity + j
-      const nextI = ((i + 1) % meshDensity) * meshDensity + j
-      const nextJ = i * meshDensity + (j + 1) % meshDensity
-      const nextBoth = ((i + 1) % meshDensity) * meshDensity + (j + 1) % meshDensity
-      
-      facets.push({
-        v1: current,
-        v2: nextI,
-        v3: nextBoth,
-        v4: nextJ
-      })
+      const nextJ = j + 1 === meshDensity ? 0 : j + 1
+
+      facets[index++] = {
+        v1: rowBase + j,
+        v2: nextRowBase + j,
+        v3: nextRowBase + nextJ,
+        v4: rowBase + nextJ
+      }
     }
   }
-  
+
   return facets
 }
 
@@ -104,28 +178,33 @@ export function generateTorusGeometry(
   degree: number,
   meshDensity: number = 20
 ): TorusGeometry {
-  // Create lattice periods
-  const period1 = new Complex(p, 0)
-  const period2 = new Complex(0, q)
-  
-  // Calculate tau = period2 / period1
-  const tau = period2.divide(period1)
-  
-  // Generate lattice points for degree d approximation
-  const latticePoints = generateLatticePoints(period1, period2, degree)
-  
-  // Project to torus surface and create 3D vertices
-  const vertices = projectToTorus(latticePoints, period1, period2, meshDensity)
-  
+  // The primary lattice and its degree-d sublattice; both come from the
+  // interning factory, so repeated generations reuse the same objects and
+  // tau is derived lazily once per lattice
+  const lattice = Lattice.primary(p, q)
+  const sublattice = Lattice.sublatticeLd(p, q, degree)
+  const tau = lattice.tau
+
+  // Project to torus surface and create 3D vertices; the sublattice periods
+  // (already carrying the 2^(-d) scale from the factory) are used so the
+  // embedding reflects L_d, not just L. The sampling is implicit — vertex
+  // positions come from midpoint fractions of the fundamental domain — so
+  // no explicit grid of lattice points is materialized.
+  const { vertices, positions } = projectToTorus(
+    sublattice.omega1,
+    sublattice.omega2,
+    meshDensity
+  )
+
   // Generate facets (quadrilaterals)
   const facets = generateFacets(meshDensity)
-  
-  // Calculate elliptic invariants (simplified)
-  const jInvariant = new Complex(1728, 0) // Placeholder
-  const discriminant = period1.multiply(period2)
-  
+
+  // Calculate elliptic invariants from the numeric Eisenstein series
+  const { jInvariant, discriminant } = calculateEllipticInvariants(p, q)
+
   return {
     vertices,
+    positions,
     facets,
     jInvariant,
     discriminant,